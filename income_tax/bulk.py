@@ -0,0 +1,106 @@
+"""Vectorized Form 8962, Part I (Lines 3-8b) over a DataFrame of returns.
+
+Gives the same results as building one `Form8962` per row, without the
+per-row pydantic overhead.
+"""
+
+import numpy as np
+import pandas as pd
+
+from income_tax.models.data_models import (
+    StateOfResidenceEnum,
+    applicable_figures,
+    poverty_lines,
+)
+
+# Rows of the poverty line arrays are indexed by ``StateOfResidenceEnum.value - 1``.
+_STATES = sorted(StateOfResidenceEnum, key=lambda state: state.value)
+_STATE_INDEX = {state: state.value - 1 for state in _STATES}
+
+_LARGEST_SIZE = min(
+    max(poverty_lines.get_state_table(state).values) for state in _STATES
+)
+
+_POVERTY_ARR = np.array(
+    [
+        [
+            poverty_lines.get_poverty_rate(state, size)
+            for size in range(1, _LARGEST_SIZE + 1)
+        ]
+        for state in _STATES
+    ],
+    dtype=np.int32,
+)
+
+_EXTRA_ARR = np.array(
+    [poverty_lines.get_state_table(state).additional_person_extra for state in _STATES],
+    dtype=np.int32,
+)
+
+_FIG_ARR = np.array(
+    [applicable_figures.get_figure(percent) for percent in range(150, 401)],
+    dtype=np.float64,
+)
+
+
+def compute_forms_df(df: pd.DataFrame) -> pd.DataFrame:
+    """Compute Lines 3-8b for every return in `df`.
+
+    Args:
+      df: one row per return with columns ``modified_agi``,
+        ``state_of_residence`` (`StateOfResidenceEnum` members) and
+        ``tax_family_size``, plus an optional ``dependents_modified_agi``
+        where NaN means not applicable
+
+    Returns:
+      A DataFrame with the same index as `df` and one column per computed
+      field of `Form8962`, from ``household_income`` to
+      ``monthly_contribution``.
+
+    Raises:
+      ValueError: if a state is unknown or ``modified_agi`` is missing
+    """
+    state_index = df["state_of_residence"].map(_STATE_INDEX).to_numpy()
+    if pd.isna(state_index).any():
+        msg = "Unknown value in 'state_of_residence'"
+        raise ValueError(msg)
+    state_index = state_index.astype(np.int64)
+    family_size = df["tax_family_size"].to_numpy(dtype=np.int64)
+
+    in_table = (family_size >= 1) & (family_size <= _LARGEST_SIZE)
+    table_value = _POVERTY_ARR[state_index, np.clip(family_size, 1, _LARGEST_SIZE) - 1]
+    extrapolated = (
+        _POVERTY_ARR[state_index, -1]
+        + (family_size - _LARGEST_SIZE) * _EXTRA_ARR[state_index]
+    )
+    poverty_line = np.where(in_table, table_value, extrapolated).astype(np.int64)
+
+    modified_agi = df["modified_agi"].to_numpy(dtype=np.float64)
+    if np.isnan(modified_agi).any():
+        msg = "Missing value in 'modified_agi'"
+        raise ValueError(msg)
+    household_income = np.trunc(modified_agi)
+    if "dependents_modified_agi" in df:
+        dependents = df["dependents_modified_agi"].to_numpy(dtype=np.float64)
+        household_income = household_income + np.nan_to_num(np.trunc(dependents))
+    household_income = household_income.astype(np.int64)
+
+    percentage = household_income / poverty_line
+    percent = np.where(percentage <= 4.0, np.trunc(percentage * 100), 401)
+    percent = percent.astype(np.int64)
+
+    applicable_figure = _FIG_ARR[np.clip(percent, 150, 400) - 150]
+    annual_contribution = np.rint(household_income * applicable_figure).astype(np.int64)
+    monthly_contribution = np.rint(annual_contribution / 12).astype(np.int64)
+
+    return pd.DataFrame(
+        {
+            "household_income": household_income,
+            "poverty_line": poverty_line,
+            "percent_of_poverty_line": percent,
+            "applicable_figure": applicable_figure,
+            "annual_contribution": annual_contribution,
+            "monthly_contribution": monthly_contribution,
+        },
+        index=df.index,
+    )
@@ -1,8 +1,11 @@
-from pydantic import Secret
+from collections.abc import Mapping
+from functools import cached_property
+from pydantic import BaseModel, Secret
 from pydantic.functional_validators import BeforeValidator
+from typing_extensions import Self
 
 
-from typing import Annotated
+from typing import Annotated, Any
 
 
 def make_whole_number(value: float) -> int:
@@ -25,9 +28,31 @@ def make_whole_number(value: float) -> int:
     return int(value)
 
 
-WholeDollar = Annotated[float, BeforeValidator(make_whole_number)]
+# Same truncation as `make_whole_number`, using the builtin so validation
+# skips a Python-level call.
+WholeDollar = Annotated[int, BeforeValidator(int)]
 
 
 class SSN(Secret[str]):
     def _display(self) -> str:
         return "***-**-****"
+
+
+class CachedPropertiesModel(BaseModel):
+    """Model whose `cached_property` values are dropped when copied with updates.
+
+    `model_copy` copies the instance ``__dict__``, where `cached_property`
+    stores its values, so without this a copy made with ``update`` would keep
+    values derived from the original fields.
+    """
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            for klass in type(copied).__mro__:
+                for name, value in vars(klass).items():
+                    if isinstance(value, cached_property):
+                        copied.__dict__.pop(name, None)
+        return copied
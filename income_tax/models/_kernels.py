@@ -0,0 +1,71 @@
+"""Scalar arithmetic for Form 8962, Part I (Lines 3-8b).
+
+These functions take plain numbers so the arithmetic stays independent of
+the `Form8962` model and its validation.
+"""
+
+from typing import NamedTuple
+
+from income_tax.custom_types import make_whole_number
+from income_tax.models.data_models import applicable_figures
+
+
+class Form8962Result(NamedTuple):
+    """Lines 3 and 5-8b of a single return."""
+
+    household_income: int
+    percent_of_poverty_line: int
+    applicable_figure: float
+    annual_contribution: int
+    monthly_contribution: int
+
+
+def household_income(modified_agi: int, dependents_modified_agi: int | None) -> int:
+    """Line 3."""
+    if dependents_modified_agi is None:
+        return modified_agi
+    return modified_agi + dependents_modified_agi
+
+
+def percent_of_poverty_line(household_income: int, poverty_line: int) -> int:
+    """Line 5."""
+    percentage = household_income / poverty_line
+    return make_whole_number(percentage * 100) if percentage <= 4.0 else 401
+
+
+def annual_contribution(household_income: int, applicable_figure: float) -> int:
+    """Line 8a."""
+    return round(household_income * applicable_figure)
+
+
+def monthly_contribution(annual_contribution: int) -> int:
+    """Line 8b."""
+    return round(annual_contribution / 12)
+
+
+def compute_form8962(
+    modified_agi: int,
+    dependents_modified_agi: int | None,
+    poverty_line: int,
+) -> Form8962Result:
+    """Run Lines 3-8b for a single return.
+
+    Args:
+      modified_agi: Line 2a
+      dependents_modified_agi: Line 2b, or None if not applicable
+      poverty_line: Line 4
+
+    Returns:
+      The computed Part I lines.
+    """
+    income = household_income(modified_agi, dependents_modified_agi)
+    percent = percent_of_poverty_line(income, poverty_line)
+    figure = applicable_figures.get_figure(percent)
+    annual = annual_contribution(income, figure)
+    return Form8962Result(
+        household_income=income,
+        percent_of_poverty_line=percent,
+        applicable_figure=figure,
+        annual_contribution=annual,
+        monthly_contribution=monthly_contribution(annual),
+    )
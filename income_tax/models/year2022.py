@@ -1,16 +1,39 @@
 import re
-from pydantic import BaseModel, Field, computed_field, field_validator
+from functools import cache, cached_property
+from typing import TYPE_CHECKING, Any
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    computed_field,
+    field_validator,
+    model_validator,
+)
 
-from income_tax.custom_types import SSN, WholeDollar, make_whole_number
+from income_tax.custom_types import SSN, CachedPropertiesModel, WholeDollar
+from income_tax.models import _kernels
 from income_tax.models.data_models import (
     StateOfResidenceEnum,
     poverty_lines,
-    applicable_figures,
 )
-from pypdffill.mappers import FieldMapper, PdfForm  # type: ignore[import-untyped]
+
+if TYPE_CHECKING:
+    from pypdffill.mappers import PdfForm  # type: ignore[import-untyped]
+
+_SSN_RE = re.compile(r"^\d{3}-\d{2}-\d{4}$|^\d{9}$")
+
+
+@cache
+def _poverty_rate(
+    state_of_residence: StateOfResidenceEnum, tax_family_size: int
+) -> WholeDollar:
+    return poverty_lines.get_poverty_rate(state_of_residence, tax_family_size)
 
 
 class MonthlyCalculationRow(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     a: WholeDollar = Field(
         description="Monthly premiums, Form(s) 1095-A, lines 21-32, column A"
     )
@@ -33,45 +56,90 @@ class MonthlyCalculationRow(BaseModel):
     @property
     def monthly_allowed_tax_credit(self) -> WholeDollar:
         """Line 12-23(e)."""
-        return min([self.a, self.monthly_max_premium_assist])
+        return min(self.a, self.monthly_max_premium_assist)
+
+
+MONTHS = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+
+
+def _month_property(index: int) -> property:
+    def getter(self: "MonthlyCalculationTable") -> MonthlyCalculationRow | None:
+        return self.months[index]
+
+    return property(getter, doc=f"Row for {MONTHS[index].title()}.")
 
 
 class MonthlyCalculationTable(BaseModel):
-    january: MonthlyCalculationRow | None = None
-    february: MonthlyCalculationRow | None = None
-    march: MonthlyCalculationRow | None = None
-    april: MonthlyCalculationRow | None = None
-    may: MonthlyCalculationRow | None = None
-    june: MonthlyCalculationRow | None = None
-    july: MonthlyCalculationRow | None = None
-    august: MonthlyCalculationRow | None = None
-    september: MonthlyCalculationRow | None = None
-    october: MonthlyCalculationRow | None = None
-    november: MonthlyCalculationRow | None = None
-    december: MonthlyCalculationRow | None = None
+    """Lines 12-23, one slot per month from January to December."""
+
+    model_config = ConfigDict(frozen=True)
+
+    months: tuple[MonthlyCalculationRow | None, ...] = Field(
+        default=(None,) * len(MONTHS),
+        min_length=len(MONTHS),
+        max_length=len(MONTHS),
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def collect_named_months(cls, data: Any) -> Any:
+        """Accept rows passed by month name, e.g. ``january=row``."""
+        if not isinstance(data, dict) or not any(month in data for month in MONTHS):
+            return data
+        data = dict(data)
+        months: list[Any] = [None] * len(MONTHS)
+        if (given := data.pop("months", None)) is not None:
+            given = list(given)
+            if len(given) != len(MONTHS):
+                msg = f"Expected {len(MONTHS)} months, got {len(given)}"
+                raise ValueError(msg)
+            months[:] = given
+        for index, month in enumerate(MONTHS):
+            if month in data:
+                months[index] = data.pop(month)
+        data["months"] = months
+        return data
+
+    january = _month_property(0)
+    february = _month_property(1)
+    march = _month_property(2)
+    april = _month_property(3)
+    may = _month_property(4)
+    june = _month_property(5)
+    july = _month_property(6)
+    august = _month_property(7)
+    september = _month_property(8)
+    october = _month_property(9)
+    november = _month_property(10)
+    december = _month_property(11)
 
     @property
     def total_tax_credit(self) -> WholeDollar:
-        credit_sum = WholeDollar(0)
-        for field in self.model_fields:
-            field_value = getattr(self, field)
-            if field_value is None:
-                continue
-            print(type(field_value))
-            credit_sum += WholeDollar(field_value.monthly_allowed_tax_credit)
-        return credit_sum
+        return sum(
+            row.monthly_allowed_tax_credit for row in self.months if row is not None
+        )
 
     @property
     def total_advance_payment(self) -> WholeDollar:
-        advance_sum = WholeDollar(0)
-        for field in self.model_fields_set:
-            field_value = getattr(self, field)
-            advance_sum += WholeDollar(field_value.f)
+        return sum(row.f for row in self.months if row is not None)
 
-        return advance_sum
 
+class Form8962(CachedPropertiesModel):
+    model_config = ConfigDict(frozen=True)
 
-class Form8962(BaseModel):
     name_on_return: str
     ssn: SSN = Field(description="Social Security Number")
     tax_family_size: int = Field(
@@ -107,38 +175,37 @@ class Form8962(BaseModel):
     @field_validator("ssn")
     @classmethod
     def validate_ssn_pattern(cls, value: SSN) -> SSN:
-        if re.match(r"^\d{3}-\d{2}-\d{4}$|^\d{9}$", value.get_secret_value()) is None:
+        if _SSN_RE.match(value.get_secret_value()) is None:
             msg = "Entered value of SSN is not valid."
             raise ValueError(msg)
         return value
 
+    @cached_property
+    def _part_one(self) -> _kernels.Form8962Result:
+        """Lines 3 and 5-8b, computed together in one kernel call."""
+        return _kernels.compute_form8962(
+            self.modified_agi, self.dependents_modified_agi, self.poverty_line
+        )
+
     @computed_field  # type: ignore[misc]
     @property
     def household_income(self) -> WholeDollar:
-        income = self.modified_agi
-        return (
-            income
-            if self.dependents_modified_agi is None
-            else income + self.dependents_modified_agi
-        )
+        return self._part_one.household_income
 
     @computed_field  # type: ignore[misc]
-    @property
+    @cached_property
     def poverty_line(self) -> WholeDollar:
-        return poverty_lines.get_poverty_rate(
-            self.state_of_residence, self.tax_family_size
-        )
+        return _poverty_rate(self.state_of_residence, self.tax_family_size)
 
     @computed_field  # type: ignore[misc]
     @property
     def percent_of_poverty_line(self) -> int:
-        percentage = self.household_income / self.poverty_line
-        return make_whole_number(percentage * 100) if percentage <= 4.0 else 401
+        return self._part_one.percent_of_poverty_line
 
     @computed_field  # type: ignore[misc]
     @property
     def applicable_figure(self) -> float:
-        return applicable_figures.get_figure(self.percent_of_poverty_line)
+        return self._part_one.applicable_figure
 
     @computed_field  # type: ignore[misc]
     @property
@@ -147,7 +214,7 @@ class Form8962(BaseModel):
 
         Multiplication of Household Income (Line 3) by Applicable Figure (Line 7)
         """
-        return int(round(self.household_income * self.applicable_figure, 0))
+        return self._part_one.annual_contribution
 
     @computed_field  # type: ignore[misc]
     @property
@@ -156,7 +223,7 @@ class Form8962(BaseModel):
 
         Annual contribution divided by 12 (months)
         """
-        return int(round(self.annual_contribution / 12, 0))
+        return self._part_one.monthly_contribution
 
     @computed_field  # type: ignore[misc]
     @property
@@ -181,9 +248,7 @@ class Form8962(BaseModel):
         if self.line_10:
             assert self.annual_enrollment_premiums is not None
             assert self.annual_max_premium_assist is not None
-            return min(
-                [self.annual_enrollment_premiums, self.annual_max_premium_assist]
-            )
+            return min(self.annual_enrollment_premiums, self.annual_max_premium_assist)
         return None
 
     @computed_field  # type: ignore[misc]
@@ -218,11 +283,18 @@ class Form8962(BaseModel):
         return None
 
 
-Form8962PDF = PdfForm(
-    name="Form8962",
-    fields=[FieldMapper(field_name="name", widget_type="text", widget_name="f1_1[0]")],
-    blank_pdf_path="income_tax/forms/f8962.pdf",
-)
+@cache
+def get_form8962_pdf() -> "PdfForm":
+    """Build the Form 8962 PDF mapper on first use."""
+    from pypdffill.mappers import FieldMapper, PdfForm  # type: ignore[import-untyped]
+
+    return PdfForm(
+        name="Form8962",
+        fields=[
+            FieldMapper(field_name="name", widget_type="text", widget_name="f1_1[0]")
+        ],
+        blank_pdf_path="income_tax/forms/f8962.pdf",
+    )
 
 
 if __name__ == "__main__":
@@ -242,15 +314,12 @@ if __name__ == "__main__":
     _january = MonthlyCalculationRow(
         a=700, b=500, c=my_form.monthly_contribution, f=100
     )
-    _february = _january.model_copy()
-    _march = _january.model_copy()
-    _april = _january.model_copy()
-
+    # Rows are frozen, so the same instance can be shared between months.
     _my_table = MonthlyCalculationTable(
-        january=_january, february=_february, march=_march, april=_april
+        months=(_january,) * 4 + (None,) * (len(MONTHS) - 4)
     )
 
-    my_form.monthly_calculation = _my_table
+    my_form = my_form.model_copy(update={"monthly_calculation": _my_table})
 
     table = Table(title="Calculated Values")
 
@@ -284,10 +353,11 @@ if __name__ == "__main__":
 
         calcs = my_form.monthly_calculation
 
-        for row in calcs.model_fields_set:
-            calc_row = getattr(my_form.monthly_calculation, row)
+        for month, calc_row in zip(MONTHS, calcs.months):
+            if calc_row is None:
+                continue
             monthly_calcs.add_row(
-                f"{row.title()}",
+                f"{month.title()}",
                 f"{calc_row.a:.0f}",
                 f"{calc_row.b:.0f}",
                 f"{calc_row.c:.0f}",
@@ -0,0 +1,85 @@
+import itertools
+
+import pytest
+
+from income_tax.models import _kernels
+from income_tax.models.data_models import StateOfResidenceEnum, poverty_lines
+
+pd = pytest.importorskip("pandas")
+
+from income_tax.bulk import compute_forms_df  # noqa: E402
+
+
+def test_compute_forms_df_matches_scalar_kernel() -> None:
+    rows = list(
+        itertools.product(
+            [0, 14999.99, 27750, 41625.5, 77194, 111000, 250000],
+            [None, 1200.75],
+            list(StateOfResidenceEnum),
+            [1, 4, 8, 9, 12],
+        )
+    )
+    df = pd.DataFrame(
+        rows,
+        columns=[
+            "modified_agi",
+            "dependents_modified_agi",
+            "state_of_residence",
+            "tax_family_size",
+        ],
+    )
+
+    result = compute_forms_df(df)
+
+    for (agi, dependents, state, size), computed in zip(
+        rows, result.itertuples(index=False)
+    ):
+        poverty_line = poverty_lines.get_poverty_rate(state, size)
+        expected = _kernels.compute_form8962(
+            int(agi), None if dependents is None else int(dependents), poverty_line
+        )
+        assert computed.poverty_line == poverty_line
+        assert (
+            computed.household_income,
+            computed.percent_of_poverty_line,
+            computed.applicable_figure,
+            computed.annual_contribution,
+            computed.monthly_contribution,
+        ) == expected
+
+
+def test_compute_forms_df_rejects_unknown_state() -> None:
+    df = pd.DataFrame(
+        {"modified_agi": [1], "state_of_residence": ["GUAM"], "tax_family_size": [1]}
+    )
+
+    with pytest.raises(ValueError, match="state_of_residence"):
+        compute_forms_df(df)
+
+
+def test_compute_forms_df_rejects_missing_modified_agi() -> None:
+    df = pd.DataFrame(
+        {
+            "modified_agi": [40000, float("nan")],
+            "state_of_residence": [StateOfResidenceEnum.ALASKA] * 2,
+            "tax_family_size": [2, 2],
+        }
+    )
+
+    with pytest.raises(ValueError, match="modified_agi"):
+        compute_forms_df(df)
+
+
+def test_compute_forms_df_treats_missing_dependents_agi_as_zero() -> None:
+    df = pd.DataFrame(
+        {
+            "modified_agi": [40000, 40000],
+            "dependents_modified_agi": [float("nan"), 1500],
+            "state_of_residence": [StateOfResidenceEnum.ALASKA] * 2,
+            "tax_family_size": [2, 2],
+        }
+    )
+
+    result = compute_forms_df(df)
+
+    assert result["household_income"].tolist() == [40000, 41500]
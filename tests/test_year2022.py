@@ -1,7 +1,16 @@
+import pytest
 from polyfactory.factories.pydantic_factory import ModelFactory
 from polyfactory.pytest_plugin import register_fixture
+from pydantic import ValidationError
 
-from income_tax.models.year2022 import Form8962
+from income_tax.custom_types import SSN
+from income_tax.models.data_models import StateOfResidenceEnum
+from income_tax.models.year2022 import (
+    MONTHS,
+    Form8962,
+    MonthlyCalculationRow,
+    MonthlyCalculationTable,
+)
 
 
 class Form8962Factory(ModelFactory[Form8962]): ...
@@ -14,3 +23,101 @@ def test_form_8962(form_8962: Form8962Factory) -> None:
     form_instance = form_8962.build()
 
     assert isinstance(form_instance.name_on_return, str)
+
+
+def test_form_8962_copy_recomputes_cached_fields() -> None:
+    form_instance = Form8962(
+        name_on_return="Jane Doe",
+        ssn=SSN("123-45-6789"),
+        tax_family_size=4,
+        modified_agi=55500,
+        state_of_residence=StateOfResidenceEnum.CONTIGUOUS_48_AND_DC,
+        another_taxpayer_or_alternative_calculation=False,
+        line_10=True,
+    )
+    assert form_instance.percent_of_poverty_line == 200
+
+    updated = form_instance.model_copy(update={"modified_agi": 83250})
+
+    assert updated.percent_of_poverty_line == 300
+    assert updated.annual_contribution == 4995
+    assert form_instance.percent_of_poverty_line == 200
+
+
+def test_form_8962_round_trips_through_model_dump() -> None:
+    row = MonthlyCalculationRow(a=700, b=500, c=329, f=100)
+    form_instance = Form8962(
+        name_on_return="Jane Doe",
+        ssn=SSN("123-45-6789"),
+        tax_family_size=4,
+        modified_agi=77194,
+        state_of_residence=StateOfResidenceEnum.CONTIGUOUS_48_AND_DC,
+        another_taxpayer_or_alternative_calculation=False,
+        line_10=False,
+        monthly_calculation=MonthlyCalculationTable(january=row, march=row),
+    )
+
+    table = form_instance.monthly_calculation
+    assert table is not None
+    assert MonthlyCalculationTable.model_validate(table.model_dump()) == table
+
+    restored = Form8962.model_validate(form_instance.model_dump())
+
+    assert restored == form_instance
+    assert restored.total_tax_credit == form_instance.total_tax_credit
+
+
+def test_monthly_calculation_table_named_months() -> None:
+    january = MonthlyCalculationRow(a=700, b=500, c=329, f=100)
+    june = MonthlyCalculationRow(a=400, b=600, c=329, f=50)
+    december = MonthlyCalculationRow(a=200, b=300, c=329, f=25)
+
+    table = MonthlyCalculationTable(january=january, june=june, december=december)
+
+    assert table.months[0] is january
+    assert table.months[5] is june
+    assert table.months[11] is december
+    for index, month in enumerate(MONTHS):
+        assert getattr(table, month) is table.months[index]
+    assert table.february is None
+    # 171 + 271 + 0 (no premium assistance in December)
+    assert table.total_tax_credit == 442
+    assert table.total_advance_payment == 175
+
+
+def test_monthly_calculation_table_merges_months_and_named_months() -> None:
+    row = MonthlyCalculationRow(a=700, b=500, c=329, f=100)
+
+    table = MonthlyCalculationTable(months=[row] + [None] * 11, march=row)
+
+    assert table.january is row
+    assert table.march is row
+    assert table.total_advance_payment == 200
+
+
+def test_monthly_calculation_table_rejects_wrong_length() -> None:
+    row = MonthlyCalculationRow(a=700, b=500, c=329, f=100)
+
+    with pytest.raises(ValidationError):
+        MonthlyCalculationTable(months=[], january=row)
+    with pytest.raises(ValidationError):
+        MonthlyCalculationTable(months=[row])
+
+
+def test_empty_monthly_calculation_table() -> None:
+    table = MonthlyCalculationTable()
+
+    assert table.months == (None,) * len(MONTHS)
+    assert table.total_tax_credit == 0
+    assert table.total_advance_payment == 0
+
+
+def test_monthly_calculation_table_copy_recomputes_totals() -> None:
+    row = MonthlyCalculationRow(a=700, b=500, c=329, f=100)
+    table = MonthlyCalculationTable(january=row)
+
+    updated = table.model_copy(update={"months": (row,) * len(MONTHS)})
+
+    assert updated.total_tax_credit == 171 * len(MONTHS)
+    assert updated.total_advance_payment == 100 * len(MONTHS)
+    assert table.total_advance_payment == 100